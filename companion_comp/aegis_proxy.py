@@ -77,6 +77,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger('AEGIS-Proxy')
 
+# Commands from UNTRUSTED senders that are BLOCKED and LOGGED as security events
+BLOCKED_COMMANDS = frozenset({
+    'COMMAND_LONG',
+    'COMMAND_INT',
+    'SET_MODE',
+    'MISSION_ITEM',
+    'MISSION_ITEM_INT',
+    'MISSION_COUNT',
+    'MISSION_CLEAR_ALL',
+    'MISSION_SET_CURRENT',
+    'SET_POSITION_TARGET_LOCAL_NED',
+    'SET_POSITION_TARGET_GLOBAL_INT',
+    'SET_ATTITUDE_TARGET'
+})
+
 
 class AEGISProxy:
     """
@@ -226,21 +241,6 @@ class AEGISProxy:
             return (True, None)
         
         # UNTRUSTED sender - apply restrictions
-        # Commands that should be BLOCKED and LOGGED as security events
-        BLOCKED_COMMANDS = [
-            'COMMAND_LONG',
-            'COMMAND_INT',
-            'SET_MODE',
-            'MISSION_ITEM',
-            'MISSION_ITEM_INT',
-            'MISSION_COUNT',
-            'MISSION_CLEAR_ALL',
-            'MISSION_SET_CURRENT',
-            'SET_POSITION_TARGET_LOCAL_NED',
-            'SET_POSITION_TARGET_GLOBAL_INT',
-            'SET_ATTITUDE_TARGET'
-        ]
-        
         if msg_type in BLOCKED_COMMANDS:
             reason = f"SECURITY: Command {msg_type} from UNTRUSTED source {src_ip}"
             return (False, reason)
@@ -427,7 +427,8 @@ class AEGISProxy:
         """Main proxy loop"""
         logger.info("🚀 AEGIS Proxy running... Press Ctrl+C to stop")
         
-        last_stats_time = time.time()
+        # Monotonic clock: the stats interval must not jump with NTP/wall-clock steps
+        last_stats_time = time.monotonic()
         stats_interval = 30  # Print stats every 30 seconds
         
         try:
@@ -453,9 +454,10 @@ class AEGISProxy:
                         logger.warning(f"🚫 Message BLOCKED from {src_addr[0]}")
                 
                 # Print periodic statistics
-                if time.time() - last_stats_time > stats_interval:
+                now = time.monotonic()
+                if now - last_stats_time > stats_interval:
                     self.print_statistics()
-                    last_stats_time = time.time()
+                    last_stats_time = now
                     
         except KeyboardInterrupt:
             logger.info("\n🛑 Shutting down AEGIS Proxy...")
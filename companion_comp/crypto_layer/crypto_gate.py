@@ -3,7 +3,7 @@ from .key_manager import key_manager
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-from src.logging_config import logger
+from src.logging_config import logger, hotpath_logger
 import time
 
 class CryptoGate:
@@ -29,7 +29,7 @@ class CryptoGate:
 
         Returns: (success, payload) or (False, None)
         """
-        logger.info("Performing comprehensive crypto validation")
+        hotpath_logger.info("Performing comprehensive crypto validation")
 
         try:
             # Validate key hierarchy integrity
@@ -43,7 +43,7 @@ class CryptoGate:
 
             # Validate timestamp if present in payload
             if self._validate_timestamp(payload):
-                logger.info("Crypto validation passed")
+                hotpath_logger.info("Crypto validation passed")
                 return True, payload
             else:
                 logger.warning("Timestamp validation failed")
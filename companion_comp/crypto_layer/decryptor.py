@@ -4,7 +4,7 @@ from .nonce_manager import NonceManager
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-from src.logging_config import logger
+from src.logging_config import logger, hotpath_logger
 
 # Global state for replay protection
 last_seen_counter = 0
@@ -12,11 +12,11 @@ nonce_mgr = NonceManager()
 
 def decrypt_payload(nonce: bytes, ciphertext: bytes) -> bytes:
     global last_seen_counter
-    logger.info("Decrypting payload with session key")
+    hotpath_logger.info("Decrypting payload with session key")
 
     try:
         counter = nonce_mgr.extract_counter(nonce)
-        logger.debug(f"Extracted counter: {counter}, last seen: {last_seen_counter}")
+        hotpath_logger.debug(f"Extracted counter: {counter}, last seen: {last_seen_counter}")
 
         # 🔁 Replay protection
         if counter <= last_seen_counter:
@@ -29,7 +29,7 @@ def decrypt_payload(nonce: bytes, ciphertext: bytes) -> bytes:
         cipher = AESGCM(current_key)
 
         plaintext = cipher.decrypt(nonce, ciphertext, None)
-        logger.info("Payload decrypted successfully")
+        hotpath_logger.info("Payload decrypted successfully")
 
         last_seen_counter = counter
 
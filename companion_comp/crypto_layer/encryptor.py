@@ -1,4 +1,3 @@
-from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from .key_manager import key_manager
 from .nonce_manager import NonceManager
 import sys
@@ -15,9 +14,8 @@ def encrypt_payload(payload: bytes) -> tuple[bytes, bytes]:
         nonce = nonce_mgr.next_nonce()
         logger.debug(f"Generated nonce with counter: {nonce_mgr.extract_counter(nonce)}")
 
-        # Get fresh session key (handles rotation automatically)
-        current_key = key_manager.get_active_session_key()
-        cipher = AESGCM(current_key)
+        # Cipher for the fresh session key (handles rotation automatically)
+        cipher = key_manager.get_session_cipher()
 
         ciphertext = cipher.encrypt(nonce, payload, None)
         logger.info("Payload encrypted successfully")
@@ -29,3 +27,30 @@ def encrypt_payload(payload: bytes) -> tuple[bytes, bytes]:
     except Exception as e:
         logger.error(f"Encryption failed: {e}")
         raise
+
+
+def encrypt_batch(payloads: list[bytes]) -> list[tuple[bytes, bytes]]:
+    """
+    Encrypt several payloads under one session-key lookup
+
+    Each payload is still sealed as its own AEAD message with its own nonce,
+    so the receiver decrypts them individually with decrypt_payload().
+    """
+    logger.info(f"Encrypting batch of {len(payloads)} payloads with session key")
+    try:
+        cipher = key_manager.get_session_cipher()
+        encrypt = cipher.encrypt
+        next_nonce = nonce_mgr.next_nonce
+
+        results = []
+        for payload in payloads:
+            nonce = next_nonce()
+            results.append((nonce, encrypt(nonce, payload, None)))
+
+        # One rotation-tracking update (and metadata save) per batch
+        key_manager.increment_command_counter(len(payloads))
+
+        return results
+    except Exception as e:
+        logger.error(f"Batch encryption failed: {e}")
+        raise
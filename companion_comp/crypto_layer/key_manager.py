@@ -63,6 +63,8 @@ class KeyManager:
     def __init__(self):
         self._root_key: Optional[ec.EllipticCurvePrivateKey] = None
         self._session_key: Optional[bytes] = None
+        self._session_cipher: Optional[AESGCM] = None
+        self._session_cipher_key: Optional[bytes] = None
         self._metadata: Dict[str, KeyMetadata] = {}
         self._command_counter = 0
         self._last_rotation_check = time.time()
@@ -260,6 +262,14 @@ class KeyManager:
 
         return self._session_key
 
+    def get_session_cipher(self) -> AESGCM:
+        """Get an AESGCM context for the active session key, rebuilt only when the key changes"""
+        current_key = self.get_active_session_key()
+        if self._session_cipher is None or current_key != self._session_cipher_key:
+            self._session_cipher = AESGCM(current_key)
+            self._session_cipher_key = current_key
+        return self._session_cipher
+
     def _check_rotation_triggers(self):
         """Check if key rotation is needed based on various triggers"""
         current_time = time.time()
@@ -341,6 +351,10 @@ class KeyManager:
             self._session_key = secrets.token_bytes(32)
             self._session_key = None
 
+        # Drop the cached AEAD context and its copy of the key
+        self._session_cipher = None
+        self._session_cipher_key = None
+
         # Overwrite on disk
         try:
             with open(SESSION_KEY_FILE, "wb") as f:
@@ -354,9 +368,9 @@ class KeyManager:
 
         logger.info("Session key destroyed securely")
 
-    def increment_command_counter(self):
+    def increment_command_counter(self, count: int = 1):
         """Increment command counter for rotation tracking"""
-        self._command_counter += 1
+        self._command_counter += count
         metadata = self._metadata.get("session")
         if metadata:
             metadata.command_count = self._command_counter
@@ -7,18 +7,24 @@ from src.logging_config import logger
 
 NONCE_SIZE = 12  # AES-GCM standard
 
+# Counter occupies the last 8 bytes of the nonce (big-endian)
+_COUNTER = struct.Struct(">Q")
+_COUNTER_OFFSET = NONCE_SIZE - _COUNTER.size
+
 class NonceManager:
     def __init__(self):
         logger.debug("Initializing NonceManager")
         self.counter = 0
+        self._buf = bytearray(NONCE_SIZE)
 
     def next_nonce(self):
         self.counter += 1
-        nonce = struct.pack(">Q", self.counter).rjust(NONCE_SIZE, b'\x00')
+        _COUNTER.pack_into(self._buf, _COUNTER_OFFSET, self.counter)
+        nonce = bytes(self._buf)
         logger.debug(f"Generated nonce for counter: {self.counter}")
         return nonce
 
     def extract_counter(self, nonce):
-        counter = struct.unpack(">Q", nonce[-8:])[0]
+        counter = _COUNTER.unpack_from(nonce, len(nonce) - _COUNTER.size)[0]
         logger.debug(f"Extracted counter: {counter}")
         return counter
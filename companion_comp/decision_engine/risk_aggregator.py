@@ -22,7 +22,11 @@ NEW: Integrates ML-based intent inference as ADVISORY input
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
+from bisect import bisect_right
 import json
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class DecisionState(Enum):
@@ -42,7 +46,7 @@ class Severity(Enum):
     CRITICAL = "CRITICAL"
 
 
-@dataclass
+@dataclass(slots=True)
 class DecisionResult:
     """Complete decision output"""
     decision: DecisionState
@@ -108,8 +112,13 @@ class RiskProportionalDecisionEngine:
         # ML integration flag
         self.use_ml_intent = config.get("use_ml_intent", True)
         
-        print("✅ Risk-Proportional Decision Engine initialized")
-        print(f"   ML Intent Inference: {'Enabled' if self.use_ml_intent else 'Disabled'}")
+        # Severity lookup: risk below bins[i] maps to table[i]
+        self._severity_bins = (0.3, 0.5, 0.7, 0.9)
+        self._severity_table = (Severity.NONE, Severity.LOW, Severity.MEDIUM,
+                                Severity.HIGH, Severity.CRITICAL)
+        
+        logger.info("Risk-Proportional Decision Engine initialized (ML intent inference: %s)",
+                    "Enabled" if self.use_ml_intent else "Disabled")
     
     def aggregate_risk(self, 
                       crypto_valid: bool,
@@ -190,16 +199,7 @@ class RiskProportionalDecisionEngine:
         
         HIGH severity = inevitable unsafe outcome predicted
         """
-        if risk < 0.3:
-            return Severity.NONE
-        elif risk < 0.5:
-            return Severity.LOW
-        elif risk < 0.7:
-            return Severity.MEDIUM
-        elif risk < 0.9:
-            return Severity.HIGH
-        else:
-            return Severity.CRITICAL
+        return self._severity_table[bisect_right(self._severity_bins, risk)]
     
     def decide(self,
               crypto_valid: bool,
@@ -253,7 +253,40 @@ class RiskProportionalDecisionEngine:
         )
         
         # 5. Build contributing factors (include ML)
-        factors = {
+        # Plain accepts carry only the risk summary; anything else gets
+        # the full per-layer breakdown for the audit trail
+        if decision == DecisionState.ACCEPT and ml_intent_result is None:
+            factors = self._build_factors_minimal(total_risk, crypto_valid)
+        else:
+            factors = self._build_factors_full(
+                total_risk,
+                crypto_valid,
+                intent_result,
+                behavior_result,
+                shadow_result,
+                ml_intent_result
+            )
+        
+        return DecisionResult(
+            decision=decision,
+            severity=severity,
+            confidence=confidence,
+            explanation=explanation,
+            contributing_factors=factors
+        )
+    
+    def _build_factors_minimal(self, total_risk, crypto_valid) -> Dict[str, Any]:
+        """Contributing factors for trivially accepted commands"""
+        return {
+            "risk_score": total_risk,
+            "crypto_valid": crypto_valid,
+        }
+    
+    def _build_factors_full(self, total_risk, crypto_valid, intent_result,
+                            behavior_result, shadow_result,
+                            ml_intent_result=None) -> Dict[str, Any]:
+        """Full per-layer contributing factors (include ML)"""
+        return {
             "risk_score": total_risk,
             "crypto_valid": crypto_valid,
             "intent_match": intent_result.intent_match,
@@ -269,14 +302,6 @@ class RiskProportionalDecisionEngine:
             "ml_intent_risk": ml_intent_result.intent_risk if ml_intent_result else None,
             "ml_top_features": ml_intent_result.top_features if ml_intent_result else None,
         }
-        
-        return DecisionResult(
-            decision=decision,
-            severity=severity,
-            confidence=confidence,
-            explanation=explanation,
-            contributing_factors=factors
-        )
     
     def _make_decision(self, risk, severity, crypto_valid, 
                       intent_result, behavior_result, shadow_result,
@@ -14,14 +14,29 @@ Intent Classes:
 - CONFIG: Parameter changes, setup
 """
 
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Sequence, Tuple
+from collections import deque
 from dataclasses import dataclass
+from functools import lru_cache
 from enum import Enum
 import json
+import logging
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
 
 
 class Intent(Enum):
     """Intent categories"""
+    # Members compare by identity, so hash by identity too. Enum's default
+    # hashes the member name in Python code on every dict/set lookup.
+    __hash__ = object.__hash__
+
     NAVIGATION = "NAVIGATION"
     RETURN = "RETURN"
     SURVEY = "SURVEY"
@@ -34,6 +49,8 @@ class Intent(Enum):
 
 class MissionPhase(Enum):
     """Current mission state"""
+    __hash__ = object.__hash__
+
     PRE_FLIGHT = "PRE_FLIGHT"
     TAKEOFF = "TAKEOFF"
     CRUISE = "CRUISE"
@@ -45,6 +62,8 @@ class MissionPhase(Enum):
 
 class FlightMode(Enum):
     """ArduPilot/PX4 flight modes"""
+    __hash__ = object.__hash__
+
     MANUAL = "MANUAL"
     STABILIZE = "STABILIZE"
     GUIDED = "GUIDED"
@@ -55,7 +74,61 @@ class FlightMode(Enum):
     UNKNOWN = "UNKNOWN"
 
 
-@dataclass
+# Intents expected in each mission phase (in reporting order), built once.
+# The membership sets also fold in EMERGENCY, which is acceptable in any phase.
+_EXPECTED_INTENTS = {
+    MissionPhase.IDLE: (Intent.CONFIG, Intent.EMERGENCY),
+    MissionPhase.PRE_FLIGHT: (Intent.CONFIG, Intent.EMERGENCY),
+    MissionPhase.TAKEOFF: (Intent.NAVIGATION, Intent.EMERGENCY, Intent.RETURN),
+    MissionPhase.CRUISE: (Intent.NAVIGATION, Intent.MANUAL_CONTROL, Intent.RETURN),
+    MissionPhase.MISSION: (Intent.NAVIGATION, Intent.SURVEY, Intent.RETURN),
+    MissionPhase.RETURN: (Intent.RETURN, Intent.EMERGENCY),
+    MissionPhase.LANDING: (Intent.EMERGENCY, Intent.RETURN)
+}
+_UNKNOWN_EXPECTED = (Intent.UNKNOWN,)
+
+# Membership sets are keyed by the expected tuple itself, so they only
+# apply when get_expected_intents() returned one of the shared tuples
+_ALLOWED_INTENTS = {
+    intents: frozenset(intents) | {Intent.EMERGENCY}
+    for intents in (*_EXPECTED_INTENTS.values(), _UNKNOWN_EXPECTED)
+}
+
+# String forms of each expected-intent tuple, for to_dict and mismatch reasons
+_EXPECTED_VALUES = {
+    intents: tuple(i.value for i in intents)
+    for intents in (*_EXPECTED_INTENTS.values(), _UNKNOWN_EXPECTED)
+}
+_EXPECTED_TEXT = {intents: str(list(values)) for intents, values in _EXPECTED_VALUES.items()}
+
+# Base inference confidence by command clarity (RETURN = high, NAVIGATION = medium)
+_BASE_CONFIDENCE = {
+    Intent.RETURN: 0.95,
+    Intent.EMERGENCY: 0.95,
+    Intent.MANUAL_CONTROL: 0.90,
+    Intent.CONFIG: 0.85,
+    Intent.NAVIGATION: 0.75,
+    Intent.SURVEY: 0.70,
+    Intent.OVERRIDE: 0.65,
+    Intent.UNKNOWN: 0.30
+}
+
+
+def _confidence_variants(base: float) -> Tuple[float, float, float, float]:
+    """
+    Final rounded confidence for each context combination, indexed by
+    (flight mode known) + 2 * (command type UNKNOWN)
+    """
+    boosted = min(1.0, base + 0.05)
+    return (round(base, 2), round(boosted, 2),
+            round(base * 0.7, 2), round(boosted * 0.7, 2))
+
+
+_CONFIDENCE = {intent: _confidence_variants(base) for intent, base in _BASE_CONFIDENCE.items()}
+_DEFAULT_CONFIDENCE = _confidence_variants(0.5)
+
+
+@dataclass(slots=True, frozen=True)
 class IntentResult:
     """Output of intent analysis"""
     intent: Intent
@@ -63,17 +136,46 @@ class IntentResult:
     intent_match: bool
     reason: str
     mission_phase: MissionPhase
-    expected_intents: list[Intent]
+    expected_intents: Sequence[Intent]
     
     def to_dict(self):
+        expected = self.expected_intents
+        # Only the shared phase tuples are cached; lists (the field's type
+        # before those tables existed) are unhashable and take the slow path
+        values = _EXPECTED_VALUES.get(expected) if isinstance(expected, tuple) else None
         return {
             "intent": self.intent.value,
             "confidence": self.confidence,
             "intent_match": self.intent_match,
             "reason": self.reason,
             "mission_phase": self.mission_phase.value,
-            "expected_intents": [i.value for i in self.expected_intents]
+            "expected_intents": list(values) if values is not None else [i.value for i in expected]
         }
+    
+    def to_json_bytes(self) -> bytes:
+        """Compact UTF-8 JSON of to_dict(), via orjson when available"""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(self.to_dict())
+        return json.dumps(self.to_dict(), separators=(",", ":")).encode()
+
+
+_MODE_BY_NAME = {fm.value: fm for fm in FlightMode}
+
+
+@lru_cache(maxsize=64)
+def _match_mode(mode_upper: str) -> FlightMode:
+    """First FlightMode whose name appears in a decorated mode string (e.g. "AUTO_MISSION")"""
+    for fm in FlightMode:
+        if fm.value in mode_upper:
+            return fm
+    return FlightMode.UNKNOWN
+
+
+def _altitude_band(altitude: float) -> int:
+    """Altitude bucket used by mission-phase inference: <2 m, 2-10 m, >10 m"""
+    if altitude < 2.0:
+        return 0
+    return 2 if altitude > 10.0 else 1
 
 
 class IntentFirewall:
@@ -90,32 +192,44 @@ class IntentFirewall:
         self.mission_active = False
         self.armed = False
         self.altitude = 0.0
-        self.command_history = []  # Last 10 commands
+        self.command_history = deque(maxlen=10)  # Last 10 commands
         
-        print("✅ Intent Firewall initialized")
+        logger.debug("Intent Firewall initialized")
     
     def update_state(self, mode: str = None, armed: bool = None, 
                      altitude: float = None, mission_active: bool = None):
         """Update vehicle state from telemetry"""
+        changed = False
         if mode:
-            self.current_mode = self._parse_mode(mode)
-        if armed is not None:
+            new_mode = self._parse_mode(mode)
+            if new_mode is not self.current_mode:
+                self.current_mode = new_mode
+                changed = True
+        if armed is not None and armed != self.armed:
             self.armed = armed
+            changed = True
         if altitude is not None:
+            # Phase only depends on which side of the 2 m / 10 m thresholds we are
+            if _altitude_band(altitude) != _altitude_band(self.altitude):
+                changed = True
             self.altitude = altitude
-        if mission_active is not None:
+        if mission_active is not None and mission_active != self.mission_active:
             self.mission_active = mission_active
+            changed = True
         
-        # Infer mission phase
-        self._update_mission_phase()
+        # Infer mission phase (most telemetry ticks change nothing it depends on)
+        if changed:
+            self._update_mission_phase()
     
     def _parse_mode(self, mode_str: str) -> FlightMode:
         """Convert mode string to enum"""
         mode_upper = mode_str.upper()
-        for fm in FlightMode:
-            if fm.value in mode_upper:
-                return fm
-        return FlightMode.UNKNOWN
+        fm = _MODE_BY_NAME.get(mode_upper)
+        if fm is not None:
+            return fm
+        # Telemetry only ever reports a handful of distinct strings, so the
+        # substring scan runs once per string
+        return _match_mode(mode_upper)
     
     def _update_mission_phase(self):
         """Infer current mission phase from state"""
@@ -201,18 +315,9 @@ class IntentFirewall:
             return self.mission_active and self.current_mode == FlightMode.AUTO
         return False
     
-    def get_expected_intents(self, phase: MissionPhase) -> list[Intent]:
+    def get_expected_intents(self, phase: MissionPhase) -> tuple[Intent, ...]:
         """What intents are expected in this mission phase?"""
-        expectations = {
-            MissionPhase.IDLE: [Intent.CONFIG, Intent.EMERGENCY],
-            MissionPhase.PRE_FLIGHT: [Intent.CONFIG, Intent.EMERGENCY],
-            MissionPhase.TAKEOFF: [Intent.NAVIGATION, Intent.EMERGENCY, Intent.RETURN],
-            MissionPhase.CRUISE: [Intent.NAVIGATION, Intent.MANUAL_CONTROL, Intent.RETURN],
-            MissionPhase.MISSION: [Intent.NAVIGATION, Intent.SURVEY, Intent.RETURN],
-            MissionPhase.RETURN: [Intent.RETURN, Intent.EMERGENCY],
-            MissionPhase.LANDING: [Intent.EMERGENCY, Intent.RETURN]
-        }
-        return expectations.get(phase, [Intent.UNKNOWN])
+        return _EXPECTED_INTENTS.get(phase, _UNKNOWN_EXPECTED)
     
     def calculate_confidence(self, intent: Intent, command_obj) -> float:
         """
@@ -222,28 +327,17 @@ class IntentFirewall:
         - Context availability
         - Historical consistency
         """
-        base_confidence = {
-            Intent.RETURN: 0.95,
-            Intent.EMERGENCY: 0.95,
-            Intent.MANUAL_CONTROL: 0.90,
-            Intent.CONFIG: 0.85,
-            Intent.NAVIGATION: 0.75,
-            Intent.SURVEY: 0.70,
-            Intent.OVERRIDE: 0.65,
-            Intent.UNKNOWN: 0.30
-        }
-        
-        conf = base_confidence.get(intent, 0.5)
+        variants = _CONFIDENCE.get(intent, _DEFAULT_CONFIDENCE)
         
         # Boost if we have good context
-        if self.current_mode != FlightMode.UNKNOWN:
-            conf = min(1.0, conf + 0.05)
+        index = self.current_mode is not FlightMode.UNKNOWN
         
         # Reduce if command type was UNKNOWN
         if command_obj.command_type == "UNKNOWN":
-            conf *= 0.7
+            index += 2
         
-        return round(conf, 2)
+        # Values were rounded once at import
+        return variants[index]
     
     def validate_intent(self, intent: Intent, confidence: float) -> IntentResult:
         """
@@ -252,16 +346,26 @@ class IntentFirewall:
         KEY RULE: Unexpected intent = MISMATCH
         Example: RTL during active survey mission = suspicious
         """
-        expected = self.get_expected_intents(self.current_phase)
+        phase = self.current_phase
+        expected = self.get_expected_intents(phase)
         
-        # Check match
-        intent_match = intent in expected or intent == Intent.EMERGENCY
+        # Check match (EMERGENCY is always acceptable). Overrides of
+        # get_expected_intents may return other sequences (e.g. lists),
+        # which take the slow path.
+        allowed = _ALLOWED_INTENTS.get(expected) if isinstance(expected, tuple) else None
+        if allowed is not None:
+            intent_match = intent in allowed
+        else:
+            intent_match = intent in expected or intent == Intent.EMERGENCY
         
         # Build reason
         if intent_match:
             reason = f"Intent '{intent.value}' expected in {self.current_phase.value}"
         else:
-            reason = f"MISMATCH: Intent '{intent.value}' unexpected in {self.current_phase.value}. Expected: {[i.value for i in expected]}"
+            expected_text = _EXPECTED_TEXT.get(expected) if isinstance(expected, tuple) else None
+            if expected_text is None:
+                expected_text = str([i.value for i in expected])
+            reason = f"MISMATCH: Intent '{intent.value}' unexpected in {self.current_phase.value}. Expected: {expected_text}"
         
         # Low confidence = suspicious
         if confidence < 0.6:
@@ -298,8 +402,6 @@ class IntentFirewall:
             "intent": intent.value,
             "timestamp": command_obj.timestamp
         })
-        if len(self.command_history) > 10:
-            self.command_history.pop(0)
         
         return result
 
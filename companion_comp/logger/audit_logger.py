@@ -11,10 +11,162 @@ For every decision:
 """
 
 import json
+import queue
+import sys
+import threading
 import time
+import weakref
 from typing import Dict, Any
 from pathlib import Path
 from datetime import datetime
+from dataclasses import dataclass, field
+
+# orjson is optional - ~5x faster serialization when installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Console output templates - built once, emitted with a single stdout write
+DECISION_ICONS = {
+    "ACCEPT": "✅",
+    "CONSTRAIN": "⚠️",
+    "HOLD": "🔶",
+    "RTL": "🚨"
+}
+
+DECISION_SUMMARY_FMT = (
+    "\n{icon} [{cmd_id}] Decision: {decision} | Severity: {severity} | Risk: {risk}\n"
+    "   Explanation: {explanation}...\n"
+)
+
+SESSION_SUMMARY_FMT = (
+    "\n" + "=" * 80 + "\n"
+    "SESSION SUMMARY\n"
+    + "=" * 80 + "\n"
+    "Session ID: {session_id}\n"
+    "Total Commands: {total_commands}\n"
+    "\nDecisions:\n"
+    "  ✅ ACCEPT:     {decisions[ACCEPT]}\n"
+    "  ⚠️  CONSTRAIN:  {decisions[CONSTRAIN]}\n"
+    "  🔶 HOLD:       {decisions[HOLD]}\n"
+    "  🚨 RTL:        {decisions[RTL]}\n"
+    "\nAcceptance Rate: {percentages[accepted_pct]}%\n"
+    "Block Rate: {percentages[blocked_pct]}%\n"
+    "\nLayer Detections:\n"
+    "  Crypto Failures:       {layer_detections[crypto_failures]}\n"
+    "  Intent Mismatches:     {layer_detections[intent_mismatches]}\n"
+    "  Behavior Anomalies:    {layer_detections[behavior_anomalies]}\n"
+    "  Geofence Violations:   {layer_detections[geofence_violations]}\n"
+    "\nAverage Risk Score: {average_risk_score}\n"
+    + "=" * 80 + "\n"
+)
+
+
+class _AuditWriter:
+    """
+    Log files, rotation state and disk I/O behind one ExplainableLogger
+
+    The writer thread and the shutdown hook hold this object rather than
+    the logger, so a logger that goes out of use can still be collected.
+    """
+    
+    def __init__(self, log_dir: Path, session_id: str, rotate_bytes: int):
+        self.log_dir = log_dir
+        self.session_id = session_id
+        
+        # Separate log files. The decision log is per session so rotation can
+        # rename it without touching another session's (or writer's) records.
+        self.decision_log = log_dir / f"decision_log.{session_id}.jsonl"
+        self.audit_log = log_dir / "audit_trail.jsonl"
+        self.human_log = log_dir / "decisions_explained.txt"
+        
+        # Decision log rotation (size-based, shards keep summaries cheap)
+        self.rotate_bytes = rotate_bytes
+        self.decision_bytes_written = (
+            self.decision_log.stat().st_size if self.decision_log.exists() else 0
+        )
+        self.rotation_count = 0
+        
+        # Set (under the logger's lock) once the writer thread is told to stop
+        self.closed = False
+        # First failed background write and how many failed since it was reported
+        self.error = None
+        self.failed_writes = 0
+        # Serializes the writer thread with synchronous writes after close
+        self._io_lock = threading.Lock()
+    
+    def write(self, decision_record, audit_record, human_text, console_text):
+        """Perform all serialization and disk I/O for one decision"""
+        cmd_id = decision_record["command_id"]
+        timestamp = datetime.fromtimestamp(
+            decision_record["ts_ns"] / 1e9
+        ).isoformat(timespec="milliseconds")
+        
+        with self._io_lock:
+            # 1. Human explanation
+            with open(self.human_log, "a", encoding='utf-8') as f:
+                f.write(f"\n[Command #{cmd_id}] {timestamp}\n")
+                f.write("-" * 80 + "\n")
+                f.write(human_text)
+                f.write("-" * 80 + "\n")
+            
+            # 2. Machine-readable decision log
+            line = json.dumps(decision_record) + "\n"
+            with open(self.decision_log, "a") as f:
+                f.write(line)
+            self.decision_bytes_written += len(line)
+            if self.decision_bytes_written > self.rotate_bytes:
+                self._rotate_decision_log()
+            
+            # 3. Audit trail (immutable, minimal)
+            with open(self.audit_log, "a") as f:
+                f.write(json.dumps(audit_record) + "\n")
+        
+        # Console output (summary)
+        sys.stdout.write(console_text)
+        sys.stdout.flush()
+    
+    def _rotate_decision_log(self):
+        """Move the full decision log aside as decision_log.{session}.{N}.jsonl"""
+        while True:
+            self.rotation_count += 1
+            shard = self.log_dir / f"decision_log.{self.session_id}.{self.rotation_count}.jsonl"
+            if not shard.exists():
+                break
+        self.decision_log.rename(shard)
+        self.decision_bytes_written = 0
+
+
+def _drain(work_queue, writer):
+    """Writer thread: consume queued decisions until the sentinel arrives"""
+    while True:
+        item = work_queue.get()
+        try:
+            if item is None:
+                return
+            writer.write(*item)
+        except Exception as e:
+            # Keep the first failure for the logger to re-raise to its caller
+            with writer._io_lock:
+                if writer.error is None:
+                    writer.error = e
+                writer.failed_writes += 1
+        finally:
+            work_queue.task_done()
+
+
+def _stop_writer(work_queue, thread, writer, lock):
+    """Drain and stop a logger's writer thread (on close, collection or exit)"""
+    with lock:
+        if writer.closed:
+            return
+        writer.closed = True
+    # Nothing is enqueued once closed is set, so the sentinel is the last item
+    work_queue.put(None)
+    thread.join()
 
 
 class ExplainableLogger:
@@ -27,21 +179,38 @@ class ExplainableLogger:
     - Immutable: Append-only log
     """
     
-    def __init__(self, log_dir: str = "logs"):
+    def __init__(self, log_dir: str = "logs", queue_size: int = 1024,
+                 rotate_bytes: int = 100 * 1024 * 1024):
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(exist_ok=True)
         
-        # Separate log files
-        self.decision_log = self.log_dir / "decision_log.jsonl"
-        self.audit_log = self.log_dir / "audit_trail.jsonl"
-        self.human_log = self.log_dir / "decisions_explained.txt"
-        
         # Session metadata
-        self.session_id = f"session_{int(time.time())}"
+        self.session_id = sys.intern(f"session_{int(time.time())}")
         self.command_counter = 0
         
+        # Log files and rotation state live with the background writer
+        self._writer = _AuditWriter(self.log_dir, self.session_id, rotate_bytes)
+        self.decision_log = self._writer.decision_log
+        self.audit_log = self._writer.audit_log
+        self.human_log = self._writer.human_log
+        
         print(f"✅ Explainable Logger initialized: {self.log_dir}")
         self._write_session_header()
+        
+        # Background writer: disk I/O off the decision path. Bounded so a
+        # stalled disk surfaces as an error instead of growing memory.
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._writer_thread = threading.Thread(
+            target=_drain, args=(self._queue, self._writer),
+            name="audit-writer", daemon=True
+        )
+        self._writer_thread.start()
+        # Runs on close(), when the logger is collected, or at interpreter
+        # exit - without the strong reference an atexit hook would keep
+        self._finalizer = weakref.finalize(
+            self, _stop_writer, self._queue, self._writer_thread, self._writer, self._lock
+        )
     
     def _write_session_header(self):
         """Write session start marker"""
@@ -73,7 +242,7 @@ class ExplainableLogger:
         # Start with decision
         explanation = f"Decision: {decision} (Severity: {severity})\n"
         explanation += f"Command: {command_obj.command_type} from {command_obj.source}\n"
-        explanation += f"Risk Score: {decision_result.contributing_factors['risk_score']}\n\n"
+        explanation += f"Risk Score: {decision_result.contributing_factors.get('risk_score')}\n\n"
         
         # Reasoning chain
         explanation += "Reasoning:\n"
@@ -130,36 +299,32 @@ class ExplainableLogger:
         1. Human-readable text
         2. Machine-readable JSONL
         3. Audit trail JSONL
+        
+        Non-blocking: writes are queued for the background writer thread.
+        Call flush() before reading the log files back. Raises RuntimeError
+        if the queue is full or an earlier queued write failed; after
+        close() decisions are written inline.
         """
+        self._raise_write_error()
         self.command_counter += 1
-        timestamp = datetime.now().isoformat()
-        
-        # 1. Human explanation
-        human_text = self.generate_human_explanation(
-            command_obj,
-            decision_result,
-            intent_result,
-            behavior_result,
-            shadow_result,
-            crypto_valid
-        )
+        # Integer epoch-ns in the JSONL records; ISO string only for humans
+        timestamp_ns = time.time_ns()
         
-        # Write to human log
-        with open(self.human_log, "a", encoding='utf-8') as f:
-            f.write(f"\n[Command #{self.command_counter}] {timestamp}\n")
-            f.write("-" * 80 + "\n")
-            f.write(human_text)
-            f.write("-" * 80 + "\n")
+        # Command type/source come from a small alphabet but arrive as fresh
+        # strings from parsing; interning lets repeats share one hashed object
+        command_type = sys.intern(command_obj.command_type)
+        source = sys.intern(command_obj.source)
         
-        # 2. Machine-readable decision log
+        # Records are built here so they snapshot the layer results as of
+        # this decision; serialization and I/O happen on the writer thread
         decision_record = {
             "session_id": self.session_id,
             "command_id": self.command_counter,
-            "timestamp": timestamp,
+            "ts_ns": timestamp_ns,
             "command": {
-                "type": command_obj.command_type,
-                "source": command_obj.source,
-                "params": command_obj.params,
+                "type": command_type,
+                "source": source,
+                "params": dict(command_obj.params),
                 "sys_id": command_obj.sys_id,
                 "comp_id": command_obj.comp_id
             },
@@ -174,55 +339,94 @@ class ExplainableLogger:
             "decision": decision_result.to_dict()
         }
         
-        with open(self.decision_log, "a") as f:
-            f.write(json.dumps(decision_record) + "\n")
-        
-        # 3. Audit trail (immutable, minimal)
         audit_record = {
             "session_id": self.session_id,
             "command_id": self.command_counter,
-            "timestamp": timestamp,
-            "command_type": command_obj.command_type,
+            "ts_ns": timestamp_ns,
+            "command_type": command_type,
             "decision": decision_result.decision.value,
             "severity": decision_result.severity.value,
-            "risk_score": decision_result.contributing_factors["risk_score"],
+            "risk_score": decision_result.contributing_factors.get("risk_score"),
             "crypto_valid": crypto_valid,
             "geofence_violation": shadow_result.predicted_outcomes.geofence_violation
         }
         
-        with open(self.audit_log, "a") as f:
-            f.write(json.dumps(audit_record) + "\n")
-        
-        # Console output (summary)
-        self._print_decision_summary(decision_result, self.command_counter)
+        # Render the text forms now as well: the layer results are live
+        # objects that may change after this call returns
+        human_text = self.generate_human_explanation(
+            command_obj, decision_result, intent_result,
+            behavior_result, shadow_result, crypto_valid
+        )
+        console_text = self._format_decision_summary(decision_result, self.command_counter)
+        item = (decision_record, audit_record, human_text, console_text)
+        
+        with self._lock:
+            if not self._writer.closed:
+                try:
+                    self._queue.put_nowait(item)
+                except queue.Full:
+                    raise RuntimeError(
+                        f"Audit log queue full ({self._queue.maxsize} decisions pending): "
+                        "writer thread is not keeping up with disk I/O"
+                    ) from None
+                return
+        
+        # Writer thread already stopped (close() or interpreter exit):
+        # write synchronously so the decision is not lost
+        self._writer.write(*item)
+    
+    def flush(self):
+        """Block until every queued decision has been written"""
+        self._queue.join()
+        self._raise_write_error()
+    
+    def close(self):
+        """Drain the queue and stop the writer thread (idempotent)"""
+        self._finalizer()
+        self._raise_write_error()
     
-    def _print_decision_summary(self, decision_result, cmd_id):
-        """Print color-coded decision summary to console"""
+    def _raise_write_error(self):
+        """Report a failed background write to the caller (once per failure)"""
+        if self._writer.error is None:
+            return
+        with self._writer._io_lock:
+            error, failed = self._writer.error, self._writer.failed_writes
+            if error is None:
+                return
+            self._writer.error = None
+            self._writer.failed_writes = 0
+        raise RuntimeError(
+            f"Audit log write failed: {failed} decision(s) were not recorded"
+        ) from error
+    
+    def _format_decision_summary(self, decision_result, cmd_id) -> str:
+        """Color-coded console summary line for one decision"""
         decision = decision_result.decision.value
-        severity = decision_result.severity.value
-        risk = decision_result.contributing_factors["risk_score"]
-        
-        # Color codes
-        colors = {
-            "ACCEPT": "✅",
-            "CONSTRAIN": "⚠️",
-            "HOLD": "🔶",
-            "RTL": "🚨"
-        }
         
-        icon = colors.get(decision, "❓")
-        
-        print(f"\n{icon} [{cmd_id}] Decision: {decision} | Severity: {severity} | Risk: {risk}")
-        print(f"   Explanation: {decision_result.explanation[:100]}...")
+        return DECISION_SUMMARY_FMT.format(
+            icon=DECISION_ICONS.get(decision, "❓"),
+            cmd_id=cmd_id,
+            decision=decision,
+            severity=decision_result.severity.value,
+            risk=decision_result.contributing_factors.get("risk_score"),
+            explanation=decision_result.explanation[:100]
+        )
     
     def get_session_summary(self) -> Dict[str, Any]:
         """
         Generate session statistics for post-flight analysis
         """
-        # Read all decisions from this session
-        decisions = []
+        # Make sure queued decisions are on disk before reading them back
+        self.flush()
+        
+        # Read all decisions from this session (its rotated shards + live log)
+        log_files = sorted(self.log_dir.glob(f"decision_log.{self.session_id}.*.jsonl"))
         if self.decision_log.exists():
-            with open(self.decision_log, "r") as f:
+            log_files.append(self.decision_log)
+        
+        decisions = []
+        for log_file in log_files:
+            with open(log_file, "r") as f:
                 for line in f:
                     record = json.loads(line)
                     if record["session_id"] == self.session_id:
@@ -243,7 +447,7 @@ class ExplainableLogger:
         high_behavior_anomalies = sum(1 for d in decisions if d["layers"]["behavior"]["anomaly_level"] in ["HIGH", "MEDIUM"])
         geofence_violations = sum(1 for d in decisions if d["layers"]["shadow"]["predicted_outcomes"]["geofence_violation"])
         
-        avg_risk = sum(d["decision"]["contributing_factors"]["risk_score"] for d in decisions) / total
+        avg_risk = sum(d["decision"]["contributing_factors"].get("risk_score", 0.0) for d in decisions) / total
         
         return {
             "session_id": self.session_id,
@@ -271,30 +475,17 @@ class ExplainableLogger:
         """Print session summary to console and file"""
         summary = self.get_session_summary()
         
-        print("\n" + "="*80)
-        print("SESSION SUMMARY")
-        print("="*80)
-        print(f"Session ID: {summary['session_id']}")
-        print(f"Total Commands: {summary['total_commands']}")
-        print(f"\nDecisions:")
-        print(f"  ✅ ACCEPT:     {summary['decisions']['ACCEPT']}")
-        print(f"  ⚠️  CONSTRAIN:  {summary['decisions']['CONSTRAIN']}")
-        print(f"  🔶 HOLD:       {summary['decisions']['HOLD']}")
-        print(f"  🚨 RTL:        {summary['decisions']['RTL']}")
-        print(f"\nAcceptance Rate: {summary['percentages']['accepted_pct']}%")
-        print(f"Block Rate: {summary['percentages']['blocked_pct']}%")
-        print(f"\nLayer Detections:")
-        print(f"  Crypto Failures:       {summary['layer_detections']['crypto_failures']}")
-        print(f"  Intent Mismatches:     {summary['layer_detections']['intent_mismatches']}")
-        print(f"  Behavior Anomalies:    {summary['layer_detections']['behavior_anomalies']}")
-        print(f"  Geofence Violations:   {summary['layer_detections']['geofence_violations']}")
-        print(f"\nAverage Risk Score: {summary['average_risk_score']}")
-        print("="*80)
+        sys.stdout.write(SESSION_SUMMARY_FMT.format(**summary))
+        sys.stdout.flush()
         
         # Write to file
         summary_file = self.log_dir / f"summary_{self.session_id}.json"
-        with open(summary_file, "w") as f:
-            json.dumps(summary, indent=2)
+        if ORJSON_AVAILABLE:
+            with open(summary_file, "wb") as f:
+                f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(summary_file, "w") as f:
+                json.dump(summary, f, indent=2)
         
         print(f"\n📊 Full summary saved to: {summary_file}")
 
@@ -304,43 +495,54 @@ def main():
     logger = ExplainableLogger()
     
     # Mock objects for testing
+    @dataclass(slots=True, frozen=True)
+    class MockValue:
+        value: str
+    
+    @dataclass(slots=True, frozen=True)
     class MockCommand:
-        command_type = "NAVIGATION"
-        source = "gcs"
-        params = {"lat": 47.0, "lon": -122.0, "alt": 50}
-        sys_id = 255
-        comp_id = 0
-        timestamp = time.time()
+        command_type: str = "NAVIGATION"
+        source: str = "gcs"
+        params: Dict[str, Any] = field(default_factory=lambda: {"lat": 47.0, "lon": -122.0, "alt": 50})
+        sys_id: int = 255
+        comp_id: int = 0
+        timestamp: float = field(default_factory=time.time)
     
+    @dataclass(slots=True, frozen=True)
     class MockIntent:
-        intent = type('obj', (object,), {'value': 'NAVIGATION'})
-        confidence = 0.85
-        intent_match = True
-        mission_phase = type('obj', (object,), {'value': 'MISSION'})
-        reason = "Intent matches mission phase"
-        def to_dict(self): return {"intent": "NAVIGATION", "confidence": 0.85}
+        intent: MockValue = MockValue("NAVIGATION")
+        confidence: float = 0.85
+        intent_match: bool = True
+        mission_phase: MockValue = MockValue("MISSION")
+        reason: str = "Intent matches mission phase"
+        def to_dict(self): return {"intent": self.intent.value, "confidence": self.confidence, "intent_match": self.intent_match}
     
+    @dataclass(slots=True, frozen=True)
     class MockBehavior:
-        behavior_score = 0.25
-        anomaly_level = "LOW"
-        explanation = "Normal behavior"
-        def to_dict(self): return {"behavior_score": 0.25, "anomaly_level": "LOW"}
+        behavior_score: float = 0.25
+        anomaly_level: str = "LOW"
+        explanation: str = "Normal behavior"
+        def to_dict(self): return {"behavior_score": self.behavior_score, "anomaly_level": self.anomaly_level}
+    
+    @dataclass(slots=True, frozen=True)
+    class MockOutcomes:
+        geofence_violation: bool = False
+        def to_dict(self): return {"geofence_violation": self.geofence_violation}
     
+    @dataclass(slots=True, frozen=True)
     class MockShadow:
-        trajectory_risk = 0.2
-        explanation = "Trajectory appears safe"
-        predicted_outcomes = type('obj', (object,), {
-            'geofence_violation': False,
-            'to_dict': lambda: {"geofence_violation": False}
-        })
-        def to_dict(self): return {"trajectory_risk": 0.2}
+        trajectory_risk: float = 0.2
+        explanation: str = "Trajectory appears safe"
+        predicted_outcomes: MockOutcomes = MockOutcomes()
+        def to_dict(self): return {"trajectory_risk": self.trajectory_risk, "predicted_outcomes": self.predicted_outcomes.to_dict()}
     
+    @dataclass(slots=True, frozen=True)
     class MockDecision:
-        decision = type('obj', (object,), {'value': 'ACCEPT'})
-        severity = type('obj', (object,), {'value': 'NONE'})
-        explanation = "All layers report acceptable risk"
-        contributing_factors = {"risk_score": 0.22}
-        def to_dict(self): return {"decision": "ACCEPT", "severity": "NONE"}
+        decision: MockValue = MockValue("ACCEPT")
+        severity: MockValue = MockValue("NONE")
+        explanation: str = "All layers report acceptable risk"
+        contributing_factors: Dict[str, Any] = field(default_factory=lambda: {"risk_score": 0.22})
+        def to_dict(self): return {"decision": self.decision.value, "severity": self.severity.value, "contributing_factors": self.contributing_factors}
     
     # Log a decision
     logger.log_decision(
@@ -1,19 +1,121 @@
+import atexit
 import time
 import json
 import os
+import queue
+import threading
+
+# Fastest available encoder: orjson, then ujson, then stdlib json
+try:
+    import orjson
+
+    def _encode_line(event) -> bytes:
+        return orjson.dumps(event, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    try:
+        import ujson as _json
+    except ImportError:
+        _json = json
+
+    def _encode_line(event) -> bytes:
+        return (_json.dumps(event) + "\n").encode()
 
 LOG_FILE = "logs/decision_log.jsonl"
 
+# Flush the buffered handle at least this often while events keep arriving
+FLUSH_EVERY = 64
+
+# (path, encoded line) pairs; the path is LOG_FILE as of the log_event call
+_queue = queue.Queue()
+
+# Started on the first log_event, not at import
+_writer_thread = None
+_writer_lock = threading.Lock()
+
+# (epoch second, formatted string) - strftime runs once per second, not per event
+_ts_cache = (0, "")
+
+
+def _same_file(f, path):
+    """True while `path` still names the file behind handle `f` (not renamed or removed)"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return False
+    fst = os.fstat(f.fileno())
+    return (st.st_ino, st.st_dev) == (fst.st_ino, fst.st_dev)
+
+
+def _writer():
+    """Drain queued events into a persistent, buffered append handle"""
+    f = None
+    f_path = None
+    pending = 0
+    while True:
+        path, line = _queue.get()
+        try:
+            # Reopen when LOG_FILE changed, or when the file was rotated or
+            # removed under us (checked once per batch, not per event)
+            if f is not None and (path != f_path or (pending == 0 and not _same_file(f, path))):
+                f.close()
+                f = None
+                pending = 0
+            if f is None:
+                # Ensure logs directory exists
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                f = open(path, "ab", buffering=64 * 1024)
+                f_path = path
+            f.write(line)
+            pending += 1
+            # Combine everything that queued up behind us into one flush
+            if pending >= FLUSH_EVERY or _queue.empty():
+                f.flush()
+                pending = 0
+        except OSError as e:
+            print(f"⚠️  Event log write failed: {e}")
+        finally:
+            _queue.task_done()
+
+
+def _ensure_writer():
+    """Start the writer thread if it is not running yet"""
+    global _writer_thread
+    if _writer_thread is not None:
+        return
+    with _writer_lock:
+        if _writer_thread is None:
+            thread = threading.Thread(target=_writer, name="event-writer", daemon=True)
+            thread.start()
+            _writer_thread = thread
+
+
+def flush():
+    """Block until every queued event has been written"""
+    _queue.join()
+
+
+atexit.register(flush)
+
+
+def _timestamp():
+    """Local-time "%Y-%m-%d %H:%M:%S" string, reused within the same second"""
+    global _ts_cache
+    sec = int(time.time())
+    cached_sec, cached_str = _ts_cache
+    if sec != cached_sec:
+        cached_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+        _ts_cache = (sec, cached_str)
+    return cached_str
+
+
 def log_event(status, reason, command):
     event = {
-        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "timestamp": _timestamp(),
         "status": status,
         "reason": reason,
         "command": command
     }
 
-    # Ensure logs directory exists
-    os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
-
-    with open(LOG_FILE, "a") as f:
-        f.write(json.dumps(event) + "\n")
\ No newline at end of file
+    # Serialize here so the record snapshots `command` as of this call
+    _ensure_writer()
+    _queue.put((LOG_FILE, _encode_line(event)))
@@ -1,17 +1,56 @@
-from collections import deque
+from typing import NamedTuple
 import time
 
+import numpy as np
+
+
+class HistoryEntry(NamedTuple):
+    timestamp: float
+    lat: float
+    lon: float
+    alt: float
+    mode: int
+
+
 class CommandHistory:
+    """
+    Fixed-size ring of recent commands, stored column-wise (one array per field)
+    so physics checks can read timestamps/positions without touching dicts.
+    """
+
     def __init__(self, max_len=20):
-        self.commands = deque(maxlen=max_len)
+        self.max_len = max_len
+        self.ts = np.zeros(max_len)
+        self.lat = np.zeros(max_len)
+        self.lon = np.zeros(max_len)
+        self.alt = np.zeros(max_len)
+        self.mode = np.zeros(max_len, dtype=np.int32)
+        self.head = 0   # next slot to write
+        self.count = 0
+
+    def __len__(self):
+        return self.count
 
     def add(self, command_dict):
-        self.commands.append({
-            "command": command_dict,
-            "timestamp": time.time()
-        })
+        i = self.head
+        self.ts[i] = time.time()
+        self.lat[i] = command_dict.get("lat", 0.0)
+        self.lon[i] = command_dict.get("lon", 0.0)
+        self.alt[i] = command_dict.get("alt", 0.0)
+        self.mode[i] = command_dict.get("mode", 0)
+        self.head = (i + 1) % self.max_len
+        if self.count < self.max_len:
+            self.count += 1
+
+    def _entry(self, i):
+        return HistoryEntry(
+            float(self.ts[i]), float(self.lat[i]), float(self.lon[i]),
+            float(self.alt[i]), int(self.mode[i])
+        )
 
     def last(self):
-        if len(self.commands) < 2:
+        if self.count < 2:
             return None, None
-        return self.commands[-2], self.commands[-1]
+        curr = (self.head - 1) % self.max_len
+        prev = (self.head - 2) % self.max_len
+        return self._entry(prev), self._entry(curr)
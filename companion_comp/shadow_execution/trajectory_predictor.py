@@ -1,4 +1,3 @@
-import joblib
 import numpy as np
 
 MODEL_FILE = "ai_layer/trust_model.joblib"
@@ -7,13 +6,26 @@ class TrustModel:
     def __init__(self):
         # Force heuristic for performance testing
         self.model = None
-        # try:
+        # joblib is imported lazily: it is slow to import and only needed
+        # when a trained model is actually on disk
+        # if os.path.exists(MODEL_FILE):
+        #     import joblib
         #     self.model = joblib.load(MODEL_FILE)
-        # except:
+        # else:
         #     # Fallback to simple heuristic for performance testing
-        #     self.model = None
         #     print("⚠️  AI model not found, using simple heuristic")
 
+        # Heuristic thresholds as arrays for batch scoring
+        # Order: d_lat, d_lon, d_alt (compared as abs), dt, velocity, mode_change
+        self._upper = np.array([0.01, 0.01, 2.0, 2.0, 1.0, 0.0])
+        self._lower = np.array([-np.inf, -np.inf, -np.inf, 0.5, -np.inf, -np.inf])
+        self._penalty = np.array([-0.1, -0.1, -0.2, -0.1, -0.2, -0.1])
+
+        # Reused (1, n_features) model input, allocated on first inference.
+        # float32 because sklearn's tree ensembles validate input as float32,
+        # so float64 rows would be copied down on every call
+        self._scratch = None
+
     def trust_score(self, feature_vector):
         """
         Returns anomaly score:
@@ -22,9 +34,10 @@ class TrustModel:
         """
         if self.model is not None:
             # Use trained model
-            score = self.model.decision_function(
-                np.array(feature_vector).reshape(1, -1)
-            )[0]
+            if self._scratch is None:
+                self._scratch = np.empty((1, len(feature_vector)), dtype=np.float32)
+            self._scratch[0, :] = feature_vector
+            score = self.model.decision_function(self._scratch)[0]
             return score
         else:
             # Simple heuristic for performance testing
@@ -42,3 +55,18 @@ class TrustModel:
             if mode_change > 0: score -= 0.1
 
             return score
+
+    def trust_score_batch(self, feature_matrix):
+        """
+        Heuristic trust scores for an (N, 6) feature matrix in one pass
+
+        Single vectors should use trust_score(): for one row the scalar
+        branches are cheaper than building arrays.
+        """
+        if self.model is not None:
+            return self.model.decision_function(np.asarray(feature_matrix, dtype=np.float32))
+
+        x = np.array(feature_matrix, dtype=np.float64, ndmin=2)
+        np.abs(x[:, :3], out=x[:, :3])
+        violations = (x > self._upper) | (x < self._lower)
+        return violations @ self._penalty
@@ -1,7 +1,10 @@
 """
 Logging configuration for AEGIS security system
 """
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 
@@ -22,3 +25,54 @@ logging.basicConfig(
 # Create logger instance
 logger = logging.getLogger("AEGIS")
 logger.setLevel(logging.INFO)
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that discards records instead of blocking when the queue is full"""
+
+    def __init__(self, queue):
+        super().__init__(queue)
+        self.dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _RootForwardingHandler(logging.Handler):
+    """Hands records to the root logger's handlers as they are at emit time"""
+
+    def emit(self, record):
+        # Looked up per record, so handlers added to the root after import
+        # (e.g. by a later basicConfig) also receive hot-path records
+        for handler in logging.getLogger().handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+# Per-packet logger for hot paths (crypto checks under flood/replay):
+# records go to a bounded in-memory queue and are written by a background
+# listener, so a burst of routine INFO/DEBUG records never blocks on
+# stdout/file I/O. Security events (WARNING and above) belong on the
+# synchronous `logger`, since this path may drop records under load.
+_hotpath_queue = queue.Queue(maxsize=10000)
+_hotpath_handler = DroppingQueueHandler(_hotpath_queue)
+hotpath_logger = logging.getLogger("AEGIS.hotpath")
+hotpath_logger.setLevel(logging.INFO)
+hotpath_logger.addHandler(_hotpath_handler)
+hotpath_logger.propagate = False
+
+_hotpath_listener = logging.handlers.QueueListener(_hotpath_queue, _RootForwardingHandler())
+_hotpath_listener.start()
+
+
+def _stop_hotpath_listener():
+    """Flush the hot-path queue and report how many records it had to drop"""
+    _hotpath_listener.stop()
+    if _hotpath_handler.dropped:
+        logger.warning(f"Hot-path logger dropped {_hotpath_handler.dropped} records (queue full)")
+
+
+atexit.register(_stop_hotpath_listener)
@@ -0,0 +1,196 @@
+"""
+Explainable Audit Logger Test Suite
+
+Tests the companion computer audit layer:
+1. Decision logging to JSONL / human logs
+2. Session summary generation
+3. Writer thread lifecycle
+
+Run with: pytest test_audit_logger.py -v
+"""
+
+import gc
+import json
+import threading
+import time
+import weakref
+import pytest
+from pathlib import Path
+from types import SimpleNamespace
+import sys
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from companion_comp.logger.audit_logger import ExplainableLogger
+from companion_comp.decision_engine.risk_aggregator import DecisionResult, DecisionState, Severity
+
+
+def make_inputs(decision=DecisionState.ACCEPT, severity=Severity.NONE, risk=0.2):
+    """Build minimal stand-ins for every layer result log_decision consumes"""
+    command = SimpleNamespace(
+        command_type="NAVIGATION", source="gcs", params={"lat": 47.0},
+        sys_id=255, comp_id=0
+    )
+    intent = SimpleNamespace(
+        intent=SimpleNamespace(value="NAVIGATION"), confidence=0.9, intent_match=True,
+        mission_phase=SimpleNamespace(value="MISSION"), reason="test",
+        to_dict=lambda: {"intent": "NAVIGATION", "intent_match": True}
+    )
+    behavior = SimpleNamespace(
+        behavior_score=0.1, anomaly_level="NONE", explanation="test",
+        to_dict=lambda: {"behavior_score": 0.1, "anomaly_level": "NONE"}
+    )
+    shadow = SimpleNamespace(
+        trajectory_risk=0.1, explanation="test",
+        predicted_outcomes=SimpleNamespace(geofence_violation=False),
+        to_dict=lambda: {"trajectory_risk": 0.1,
+                         "predicted_outcomes": {"geofence_violation": False}}
+    )
+    result = DecisionResult(
+        decision=decision, severity=severity, confidence=0.9,
+        explanation="test", contributing_factors={"risk_score": risk}
+    )
+    return command, result, intent, behavior, shadow
+
+
+class TestExplainableLogger:
+    """Test audit logging and session summaries"""
+
+    def test_log_decision_writes_all_formats(self, tmp_path):
+        logger = ExplainableLogger(log_dir=str(tmp_path))
+        logger.log_decision(*make_inputs(), crypto_valid=True)
+        logger.flush()
+
+        record = json.loads(logger.decision_log.read_text().splitlines()[0])
+        assert record["session_id"] == logger.session_id
+        assert isinstance(record["ts_ns"], int)
+        assert logger.audit_log.read_text().strip()
+        assert "Decision: ACCEPT" in logger.human_log.read_text(encoding="utf-8")
+
+    def test_session_summary_file_written(self, tmp_path):
+        logger = ExplainableLogger(log_dir=str(tmp_path))
+        logger.log_decision(*make_inputs(), crypto_valid=True)
+        logger.log_decision(*make_inputs(DecisionState.RTL, Severity.CRITICAL, 0.95), crypto_valid=False)
+        logger.print_session_summary()
+
+        summary_file = tmp_path / f"summary_{logger.session_id}.json"
+        assert summary_file.stat().st_size > 0
+        summary = json.loads(summary_file.read_text())
+        assert summary["total_commands"] == 2
+        assert summary["decisions"]["RTL"] == 1
+        assert summary["layer_detections"]["crypto_failures"] == 1
+
+    def test_close_drains_queue(self, tmp_path):
+        logger = ExplainableLogger(log_dir=str(tmp_path))
+        for _ in range(20):
+            logger.log_decision(*make_inputs(), crypto_valid=True)
+        logger.close()
+
+        assert not logger._writer_thread.is_alive()
+        assert len(logger.audit_log.read_text().splitlines()) == 20
+
+    def test_decision_log_rotates_into_shards(self, tmp_path):
+        logger = ExplainableLogger(log_dir=str(tmp_path), rotate_bytes=1024)
+        for _ in range(10):
+            logger.log_decision(*make_inputs(), crypto_valid=True)
+        logger.flush()
+
+        shards = list(tmp_path.glob(f"decision_log.{logger.session_id}.*.jsonl"))
+        assert shards
+        assert all(shard.stat().st_size > 1024 for shard in shards)
+        assert logger.get_session_summary()["total_commands"] == 10
+
+    def test_concurrent_sessions_keep_separate_logs(self, tmp_path, monkeypatch):
+        first = ExplainableLogger(log_dir=str(tmp_path), rotate_bytes=1500)
+        with monkeypatch.context() as m:
+            m.setattr(time, "time", lambda: 1.0)
+            second = ExplainableLogger(log_dir=str(tmp_path), rotate_bytes=1500)
+        assert first.session_id != second.session_id
+
+        for _ in range(7):
+            first.log_decision(*make_inputs(), crypto_valid=True)
+            second.log_decision(*make_inputs(), crypto_valid=True)
+        first.flush()
+        second.flush()
+
+        for logger in (first, second):
+            files = list(tmp_path.glob(f"decision_log.{logger.session_id}.*.jsonl"))
+            assert files
+            for log_file in files + [logger.decision_log]:
+                if log_file.exists():
+                    for line in log_file.read_text().splitlines():
+                        assert json.loads(line)["session_id"] == logger.session_id
+            assert logger.get_session_summary()["total_commands"] == 7
+
+    def test_log_after_close_writes_synchronously(self, tmp_path):
+        logger = ExplainableLogger(log_dir=str(tmp_path), queue_size=4)
+        logger.close()
+        for _ in range(10):
+            logger.log_decision(*make_inputs(), crypto_valid=True)
+
+        assert len(logger.audit_log.read_text().splitlines()) == 10
+
+    def test_full_queue_raises_instead_of_blocking(self, tmp_path):
+        logger = ExplainableLogger(log_dir=str(tmp_path), queue_size=2)
+        release = threading.Event()
+        write = logger._writer.write
+        logger._writer.write = lambda *item: (release.wait(), write(*item))
+
+        with pytest.raises(RuntimeError, match="queue full"):
+            for _ in range(10):
+                logger.log_decision(*make_inputs(), crypto_valid=True)
+        release.set()
+        logger.close()
+
+    def test_failed_write_is_raised_from_flush(self, tmp_path):
+        logger = ExplainableLogger(log_dir=str(tmp_path))
+        logger._writer.write = lambda *item: open(tmp_path, "a")
+        logger.log_decision(*make_inputs(), crypto_valid=True)
+        logger.log_decision(*make_inputs(), crypto_valid=True)
+
+        with pytest.raises(RuntimeError, match="2 decision") as excinfo:
+            logger.flush()
+        assert isinstance(excinfo.value.__cause__, OSError)
+
+        # Reported once; later writes go through normally
+        del logger._writer.write
+        logger.log_decision(*make_inputs(), crypto_valid=True)
+        logger.close()
+        assert len(logger.audit_log.read_text().splitlines()) == 1
+
+    def test_failed_write_is_raised_from_next_log_decision(self, tmp_path):
+        logger = ExplainableLogger(log_dir=str(tmp_path))
+        logger._writer.write = lambda *item: open(tmp_path, "a")
+        logger.log_decision(*make_inputs(), crypto_valid=True)
+        logger._queue.join()
+
+        with pytest.raises(RuntimeError, match="not recorded"):
+            logger.log_decision(*make_inputs(), crypto_valid=True)
+        logger.close()
+
+    def test_human_text_snapshots_layer_results(self, tmp_path):
+        logger = ExplainableLogger(log_dir=str(tmp_path))
+        inputs = make_inputs()
+        logger.log_decision(*inputs, crypto_valid=True)
+        inputs[3].behavior_score = 0.99
+        logger.flush()
+
+        text = logger.human_log.read_text(encoding="utf-8")
+        assert "score 0.1)" in text
+        assert "0.99" not in text
+
+    def test_unused_logger_is_collected_and_stops_writer(self, tmp_path):
+        logger = ExplainableLogger(log_dir=str(tmp_path))
+        logger.log_decision(*make_inputs(), crypto_valid=True)
+        thread = logger._writer_thread
+        audit_log = logger.audit_log
+        ref = weakref.ref(logger)
+
+        del logger
+        gc.collect()
+        thread.join(timeout=2)
+
+        assert ref() is None
+        assert not thread.is_alive()
+        assert len(audit_log.read_text().splitlines()) == 1
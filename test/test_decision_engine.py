@@ -0,0 +1,91 @@
+"""
+Risk-Proportional Decision Engine Test Suite
+
+Tests the companion computer decision layer:
+1. Risk aggregation → decision mapping
+2. Contributing factors
+
+Run with: pytest test_decision_engine.py -v
+"""
+
+from pathlib import Path
+from types import SimpleNamespace
+import sys
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from companion_comp.decision_engine.risk_aggregator import (
+    RiskProportionalDecisionEngine, DecisionState, Severity
+)
+
+
+def make_layers(intent_match=True, behavior_score=0.1, anomaly_level="NONE",
+                trajectory_risk=0.1, geofence_violation=False, time_to_violation=99.0):
+    """Build minimal stand-ins for the layer 3-5 results"""
+    intent = SimpleNamespace(
+        intent_match=intent_match, confidence=0.9, reason="test"
+    )
+    behavior = SimpleNamespace(
+        behavior_score=behavior_score, anomaly_level=anomaly_level,
+        anomaly_features=["rate"], explanation="test"
+    )
+    shadow = SimpleNamespace(
+        trajectory_risk=trajectory_risk, explanation="test",
+        predicted_outcomes=SimpleNamespace(
+            geofence_violation=geofence_violation,
+            time_to_violation=time_to_violation,
+            velocity_risk=False, altitude_risk=False
+        )
+    )
+    return intent, behavior, shadow
+
+
+class TestDecisionEngine:
+    """Test decision engine paths"""
+
+    def setup_method(self):
+        self.engine = RiskProportionalDecisionEngine()
+        self.command = SimpleNamespace(command_type="NAVIGATION")
+
+    def test_normal_command_accepted(self):
+        intent, behavior, shadow = make_layers()
+        result = self.engine.decide(True, intent, behavior, shadow, self.command)
+        assert result.decision == DecisionState.ACCEPT
+        assert "risk_score" in result.contributing_factors
+
+    def test_imminent_geofence_holds_for_review(self):
+        intent, behavior, shadow = make_layers(geofence_violation=True, time_to_violation=1.5)
+        result = self.engine.decide(True, intent, behavior, shadow, self.command)
+        assert result.decision == DecisionState.HOLD
+        assert result.severity == Severity.HIGH
+        assert result.contributing_factors["risk_score"] == 0.85
+
+    def test_crypto_failure_with_high_anomaly_holds_for_review(self):
+        intent, behavior, shadow = make_layers(behavior_score=0.9, anomaly_level="HIGH")
+        result = self.engine.decide(False, intent, behavior, shadow, self.command)
+        assert result.decision == DecisionState.HOLD
+        assert result.severity == Severity.HIGH
+        assert result.confidence == 0.75
+        assert result.contributing_factors["risk_score"] == 0.75
+
+    def test_severity_boundaries(self):
+        intent, _, shadow = make_layers()
+        cases = [(0.0, Severity.NONE), (0.29, Severity.NONE), (0.3, Severity.LOW),
+                 (0.5, Severity.MEDIUM), (0.7, Severity.HIGH), (0.9, Severity.CRITICAL),
+                 (1.0, Severity.CRITICAL)]
+        for risk, expected in cases:
+            assert self.engine.determine_severity(risk, shadow, intent) == expected
+
+    def test_accept_uses_minimal_factors(self):
+        intent, behavior, shadow = make_layers()
+        result = self.engine.decide(True, intent, behavior, shadow, self.command)
+        assert set(result.contributing_factors) == {"risk_score", "crypto_valid"}
+
+    def test_non_accept_uses_full_factors(self):
+        intent, behavior, shadow = make_layers(intent_match=False, behavior_score=0.8,
+                                               anomaly_level="HIGH", trajectory_risk=0.8)
+        result = self.engine.decide(True, intent, behavior, shadow, self.command)
+        assert result.decision != DecisionState.ACCEPT
+        assert result.contributing_factors["intent_match"] is False
+        assert "ml_intent" in result.contributing_factors
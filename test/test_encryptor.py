@@ -0,0 +1,90 @@
+"""
+Encryptor Test Suite
+
+Tests companion computer payload encryption:
+1. Batch encryption round trip through decrypt_payload
+2. Session cipher reuse across key rotation and revocation
+
+Run with: pytest test_encryptor.py -v
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+@pytest.fixture()
+def crypto_stack(tmp_path, monkeypatch):
+    """Fresh key hierarchy whose key files live in a temporary directory"""
+    # KeyManager creates ./crypto_layer, so keep it out of the working tree
+    monkeypatch.chdir(tmp_path)
+
+    from companion_comp.crypto_layer import key_manager, encryptor, decryptor
+
+    key_dir = tmp_path / "crypto_layer"
+    key_dir.mkdir(exist_ok=True)
+    monkeypatch.setattr(key_manager, "ROOT_KEY_FILE", str(key_dir / "root_key.pem"))
+    monkeypatch.setattr(key_manager, "SESSION_KEY_FILE", str(key_dir / "session_key.bin"))
+    monkeypatch.setattr(key_manager, "KEY_METADATA_FILE", str(key_dir / "key_metadata.json"))
+
+    key_mgr = key_manager.KeyManager()
+    monkeypatch.setattr(encryptor, "key_manager", key_mgr)
+    monkeypatch.setattr(decryptor, "key_manager", key_mgr)
+
+    # Reset replay protection and nonce counters
+    monkeypatch.setattr(encryptor, "nonce_mgr", encryptor.NonceManager())
+    monkeypatch.setattr(decryptor, "nonce_mgr", decryptor.NonceManager())
+    monkeypatch.setattr(decryptor, "last_seen_counter", 0)
+
+    return encryptor, decryptor, key_mgr
+
+
+def test_batch_round_trip(crypto_stack):
+    encryptor, decryptor, key_mgr = crypto_stack
+    payloads = [b"ARM", b"TAKEOFF 10", b"", b"GOTO 47.0 8.0 50"]
+
+    sealed = encryptor.encrypt_batch(payloads)
+
+    assert key_mgr._command_counter == len(payloads)
+    assert len({nonce for nonce, _ in sealed}) == len(payloads)
+    assert [decryptor.decrypt_payload(nonce, ct) for nonce, ct in sealed] == payloads
+
+
+def test_batch_interleaves_with_single_payloads(crypto_stack):
+    encryptor, decryptor, _ = crypto_stack
+
+    sealed = [encryptor.encrypt_payload(b"first")]
+    sealed += encryptor.encrypt_batch([b"second", b"third"])
+    sealed.append(encryptor.encrypt_payload(b"fourth"))
+
+    plaintexts = [decryptor.decrypt_payload(nonce, ct) for nonce, ct in sealed]
+    assert plaintexts == [b"first", b"second", b"third", b"fourth"]
+
+
+def test_cipher_rebuilt_after_rotation(crypto_stack):
+    encryptor, decryptor, key_mgr = crypto_stack
+    cipher = key_mgr.get_session_cipher()
+    assert key_mgr.get_session_cipher() is cipher
+
+    key_mgr.rotate_session_key("test")
+
+    assert key_mgr.get_session_cipher() is not cipher
+    nonce, ciphertext = encryptor.encrypt_batch([b"after rotation"])[0]
+    assert decryptor.decrypt_payload(nonce, ciphertext) == b"after rotation"
+    with pytest.raises(Exception):
+        cipher.decrypt(nonce, ciphertext, None)
+
+
+def test_revocation_drops_cached_cipher(crypto_stack):
+    encryptor, _, key_mgr = crypto_stack
+    key_mgr.get_session_cipher()
+
+    key_mgr.revoke_session_key("test")
+
+    assert key_mgr._session_cipher is None
+    assert key_mgr._session_cipher_key is None
+    with pytest.raises(ValueError):
+        encryptor.encrypt_batch([b"ARM"])
@@ -0,0 +1,69 @@
+"""
+Event Logger Test Suite
+
+Tests the legacy companion computer event log:
+1. Queued events land in the JSONL file after flush()
+
+Run with: pytest test_explainability.py -v
+"""
+
+import json
+import time
+from pathlib import Path
+import sys
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from companion_comp.logger import explainability
+
+
+class TestLogEvent:
+    """Test buffered event logging"""
+
+    def test_events_written_after_flush(self, tmp_path, monkeypatch):
+        log_file = tmp_path / "logs" / "events.jsonl"
+        monkeypatch.setattr(explainability, "LOG_FILE", str(log_file))
+
+        for i in range(10):
+            explainability.log_event("ACCEPTED", "Crypto valid & AI trust high", {"seq": i})
+        explainability.flush()
+
+        events = [json.loads(line) for line in log_file.read_text().splitlines()]
+        assert [e["command"]["seq"] for e in events] == list(range(10))
+        assert events[0]["status"] == "ACCEPTED"
+        assert "timestamp" in events[0]
+
+    def test_timestamp_matches_strftime(self):
+        before = time.strftime("%Y-%m-%d %H:%M:%S")
+        stamp = explainability._timestamp()
+        after = time.strftime("%Y-%m-%d %H:%M:%S")
+        assert stamp in (before, after)
+
+    def test_reassigned_log_file_takes_effect(self, tmp_path, monkeypatch):
+        first = tmp_path / "first.jsonl"
+        second = tmp_path / "second.jsonl"
+
+        monkeypatch.setattr(explainability, "LOG_FILE", str(first))
+        explainability.log_event("ACCEPTED", "first", {"seq": 0})
+        explainability.flush()
+        monkeypatch.setattr(explainability, "LOG_FILE", str(second))
+        explainability.log_event("ACCEPTED", "second", {"seq": 1})
+        explainability.flush()
+
+        assert [json.loads(line)["reason"] for line in first.read_text().splitlines()] == ["first"]
+        assert [json.loads(line)["reason"] for line in second.read_text().splitlines()] == ["second"]
+
+    def test_reopens_after_rotation(self, tmp_path, monkeypatch):
+        log_file = tmp_path / "events.jsonl"
+        rotated = tmp_path / "events.1.jsonl"
+        monkeypatch.setattr(explainability, "LOG_FILE", str(log_file))
+
+        explainability.log_event("ACCEPTED", "before", {"seq": 0})
+        explainability.flush()
+        log_file.rename(rotated)
+        explainability.log_event("ACCEPTED", "after", {"seq": 1})
+        explainability.flush()
+
+        assert [json.loads(line)["reason"] for line in rotated.read_text().splitlines()] == ["before"]
+        assert [json.loads(line)["reason"] for line in log_file.read_text().splitlines()] == ["after"]
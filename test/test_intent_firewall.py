@@ -0,0 +1,114 @@
+"""
+Intent Firewall Test Suite
+
+Tests the companion computer Layer 3 intent firewall:
+1. Intent inference and mission-phase matching
+2. Command history handling
+
+Run with: pytest test_intent_firewall.py -v
+"""
+
+import json
+import pytest
+from pathlib import Path
+from types import SimpleNamespace
+import sys
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from companion_comp.intent_firewall.intent_classifier import (
+    IntentFirewall, IntentResult, Intent, MissionPhase, FlightMode
+)
+
+
+def make_command(command_type="NAVIGATION", params=None, timestamp=0.0):
+    """Build a minimal stand-in for a parsed command"""
+    return SimpleNamespace(command_type=command_type, params=params or {}, timestamp=timestamp)
+
+
+class TestIntentFirewall:
+    """Test intent inference against mission context"""
+
+    def setup_method(self):
+        self.firewall = IntentFirewall()
+        self.firewall.update_state(mode="AUTO", armed=True, altitude=50.0, mission_active=True)
+
+    def test_navigation_expected_during_mission(self):
+        result = self.firewall.analyze(make_command())
+        assert self.firewall.current_phase == MissionPhase.MISSION
+        assert result.intent == Intent.NAVIGATION
+        assert result.intent_match is True
+        assert result.to_dict()["expected_intents"] == ["NAVIGATION", "SURVEY", "RETURN"]
+
+    def test_emergency_always_matches(self):
+        for phase in MissionPhase:
+            self.firewall.current_phase = phase
+            assert self.firewall.validate_intent(Intent.EMERGENCY, 0.95).intent_match is True
+
+    def test_unexpected_intent_is_mismatch(self):
+        result = self.firewall.analyze(make_command("CONFIG"))
+        assert result.intent_match is False
+        assert result.reason.startswith("MISMATCH")
+        assert "['NAVIGATION', 'SURVEY', 'RETURN']" in result.reason
+
+    def test_history_keeps_last_ten_commands(self):
+        for i in range(15):
+            self.firewall.analyze(make_command(timestamp=float(i)))
+        history = self.firewall.command_history
+        assert len(history) == 10
+        assert history[0]["timestamp"] == 5.0
+        assert history[-1]["timestamp"] == 14.0
+
+    def test_confidence_adjusts_for_context(self):
+        assert self.firewall.calculate_confidence(Intent.RETURN, make_command("RETURN")) == 1.0
+        assert self.firewall.calculate_confidence(Intent.UNKNOWN, make_command("UNKNOWN")) == 0.24
+        self.firewall.update_state(mode="SOMETHING ELSE")
+        assert self.firewall.calculate_confidence(Intent.NAVIGATION, make_command()) == 0.75
+
+    def test_phase_follows_threshold_crossings_only(self):
+        self.firewall.update_state(altitude=30.0)
+        assert self.firewall.current_phase == MissionPhase.MISSION
+        self.firewall.update_state(mode="RTL")
+        assert self.firewall.current_phase == MissionPhase.RETURN
+        self.firewall.update_state(altitude=1.0)
+        assert self.firewall.current_phase == MissionPhase.TAKEOFF
+        self.firewall.update_state(armed=False)
+        assert self.firewall.current_phase == MissionPhase.IDLE
+
+    def test_parse_mode_exact_and_decorated_names(self):
+        assert self.firewall._parse_mode("rtl") == FlightMode.RTL
+        assert self.firewall._parse_mode("GUIDED_NOGPS") == FlightMode.GUIDED
+        assert self.firewall._parse_mode("AUTO_RTL") == FlightMode.AUTO
+        assert self.firewall._parse_mode("ACRO") == FlightMode.UNKNOWN
+
+    def test_result_is_immutable(self):
+        result = self.firewall.analyze(make_command())
+        with pytest.raises(AttributeError):
+            result.intent_match = False
+
+    def test_json_bytes_matches_dict(self):
+        result = self.firewall.analyze(make_command("CONFIG"))
+        assert json.loads(result.to_json_bytes()) == result.to_dict()
+
+    def test_to_dict_accepts_list_of_expected_intents(self):
+        result = IntentResult(
+            intent=Intent.NAVIGATION, confidence=0.9, intent_match=True, reason="test",
+            mission_phase=MissionPhase.MISSION, expected_intents=[Intent.NAVIGATION, Intent.SURVEY]
+        )
+        assert result.to_dict()["expected_intents"] == ["NAVIGATION", "SURVEY"]
+        assert json.loads(result.to_json_bytes())["expected_intents"] == ["NAVIGATION", "SURVEY"]
+
+    def test_overridden_expected_intents_decide_match(self):
+        class ConfigOnlyFirewall(IntentFirewall):
+            def get_expected_intents(self, phase):
+                return [Intent.CONFIG]
+
+        firewall = ConfigOnlyFirewall()
+        firewall.update_state(mode="AUTO", armed=True, altitude=50.0, mission_active=True)
+
+        assert firewall.validate_intent(Intent.CONFIG, 0.9).intent_match is True
+        assert firewall.validate_intent(Intent.EMERGENCY, 0.9).intent_match is True
+        result = firewall.validate_intent(Intent.NAVIGATION, 0.9)
+        assert result.intent_match is False
+        assert result.reason.endswith("Expected: ['CONFIG']")
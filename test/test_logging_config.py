@@ -0,0 +1,84 @@
+"""
+Logging Configuration Test Suite
+
+Tests the hot-path logger:
+1. Bounded queue drops (and counts) records instead of blocking
+2. Records reach root handlers added after import
+3. Exit hook reports dropped records
+
+Run with: pytest test_logging_config.py -v
+"""
+
+import logging
+import queue
+import threading
+from pathlib import Path
+import sys
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import logging_config
+from src.logging_config import DroppingQueueHandler
+
+
+class _ListHandler(logging.Handler):
+    """Collects emitted records"""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class TestHotpathLogger:
+    """Test the dropping queue handler and its listener"""
+
+    def test_full_queue_drops_without_blocking(self):
+        records = queue.Queue(maxsize=2)
+        test_logger = logging.getLogger("AEGIS.test.dropping")
+        test_logger.propagate = False
+        handler = DroppingQueueHandler(records)
+        test_logger.addHandler(handler)
+        try:
+            worker = threading.Thread(
+                target=lambda: [test_logger.warning("flood %d", i) for i in range(5)]
+            )
+            worker.start()
+            worker.join(timeout=2)
+
+            assert not worker.is_alive()
+            assert records.qsize() == 2
+            assert handler.dropped == 3
+        finally:
+            test_logger.removeHandler(handler)
+
+    def test_records_reach_root_handlers_added_later(self):
+        root = logging.getLogger()
+        late_handler = _ListHandler()
+        root.addHandler(late_handler)
+        try:
+            logging_config.hotpath_logger.info("late handler probe")
+            # stop() drains the queue; restart for the rest of the session
+            logging_config._hotpath_listener.stop()
+            logging_config._hotpath_listener.start()
+        finally:
+            root.removeHandler(late_handler)
+
+        assert "late handler probe" in [r.getMessage() for r in late_handler.records]
+
+    def test_exit_hook_reports_dropped_records(self, monkeypatch):
+        root = logging.getLogger()
+        handler = _ListHandler()
+        root.addHandler(handler)
+        monkeypatch.setattr(logging_config._hotpath_handler, "dropped", 7)
+        try:
+            logging_config._stop_hotpath_listener()
+            logging_config._hotpath_listener.start()
+        finally:
+            root.removeHandler(handler)
+
+        warnings = [r.getMessage() for r in handler.records if r.levelno == logging.WARNING]
+        assert warnings == ["Hot-path logger dropped 7 records (queue full)"]
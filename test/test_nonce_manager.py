@@ -0,0 +1,36 @@
+"""
+Nonce Manager Test Suite
+
+Tests companion computer nonce generation:
+1. Counter layout (zero-padded big-endian)
+2. Round-trip counter extraction
+
+Run with: pytest test_nonce_manager.py -v
+"""
+
+import struct
+from pathlib import Path
+import sys
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from companion_comp.crypto_layer.nonce_manager import NonceManager, NONCE_SIZE
+
+
+class TestNonceManager:
+    """Test nonce generation and parsing"""
+
+    def setup_method(self):
+        self.nonce_mgr = NonceManager()
+
+    def test_nonce_layout(self):
+        for expected in range(1, 5):
+            nonce = self.nonce_mgr.next_nonce()
+            assert len(nonce) == NONCE_SIZE
+            assert nonce == struct.pack(">Q", expected).rjust(NONCE_SIZE, b"\x00")
+
+    def test_nonces_are_unique_and_round_trip(self):
+        nonces = [self.nonce_mgr.next_nonce() for _ in range(100)]
+        assert len(set(nonces)) == 100
+        assert [self.nonce_mgr.extract_counter(n) for n in nonces] == list(range(1, 101))
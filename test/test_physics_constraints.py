@@ -0,0 +1,44 @@
+"""
+Command History Test Suite
+
+Tests the shadow-execution command ring buffer:
+1. last() ordering and warm-up behavior
+2. Wrap-around past max_len
+
+Run with: pytest test_physics_constraints.py -v
+"""
+
+from pathlib import Path
+import sys
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from companion_comp.shadow_execution.physics_constraints import CommandHistory
+
+
+class TestCommandHistory:
+    """Test command history ring buffer"""
+
+    def setup_method(self):
+        self.history = CommandHistory(max_len=4)
+
+    def test_last_requires_two_commands(self):
+        assert self.history.last() == (None, None)
+        self.history.add({"lat": 47.0, "lon": -122.0, "alt": 10.0})
+        assert self.history.last() == (None, None)
+
+    def test_last_returns_previous_and_current(self):
+        self.history.add({"lat": 47.0, "lon": -122.0, "alt": 10.0, "mode": 4})
+        self.history.add({"lat": 47.1, "lon": -122.1, "alt": 20.0, "mode": 6})
+        prev, curr = self.history.last()
+        assert (prev.lat, prev.alt, prev.mode) == (47.0, 10.0, 4)
+        assert (curr.lat, curr.alt, curr.mode) == (47.1, 20.0, 6)
+        assert curr.timestamp >= prev.timestamp
+
+    def test_wraps_around(self):
+        for i in range(10):
+            self.history.add({"alt": float(i)})
+        assert len(self.history) == 4
+        prev, curr = self.history.last()
+        assert (prev.alt, curr.alt) == (8.0, 9.0)
@@ -0,0 +1,57 @@
+"""
+Trust Model Test Suite
+
+Tests the shadow-execution heuristic trust model:
+1. Scalar heuristic penalties
+2. Batch scoring parity with the scalar path
+
+Run with: pytest test_trust_model.py -v
+"""
+
+import numpy as np
+import pytest
+from pathlib import Path
+import sys
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from companion_comp.shadow_execution.trajectory_predictor import TrustModel
+
+
+class TestTrustModel:
+    """Test heuristic trust scoring"""
+
+    def setup_method(self):
+        self.model = TrustModel()
+
+    def test_normal_features_score_zero(self):
+        assert self.model.trust_score([0.001, 0.001, 0.5, 1.0, 0.5, 0]) == 0.0
+
+    def test_all_violations_penalized(self):
+        score = self.model.trust_score([-0.02, 0.02, -3.0, 0.1, 2.0, 1])
+        assert score == pytest.approx(-0.8)
+
+    def test_batch_matches_scalar(self):
+        rng = np.random.default_rng(0)
+        batch = rng.normal(0.0, 1.0, size=(200, 6)) * [0.02, 0.02, 3.0, 1.5, 1.5, 1.0]
+        batch[:, 3] = np.abs(batch[:, 3])
+        expected = [self.model.trust_score(row) for row in batch.tolist()]
+        np.testing.assert_allclose(self.model.trust_score_batch(batch), expected)
+
+    def test_model_path_reuses_input_buffer(self):
+        seen = []
+
+        class StubModel:
+            def decision_function(self, X):
+                seen.append(X)
+                return X.sum(axis=1)
+
+        self.model.model = StubModel()
+        assert self.model.trust_score([1, 2, 3, 4, 5, 6]) == 21.0
+        assert self.model.trust_score([0, 0, 0, 0, 0, 1]) == 1.0
+        assert seen[0] is seen[1]
+        assert seen[0].shape == (1, 6)
+        assert seen[0].dtype == np.float32
+        self.model.trust_score_batch(np.zeros((3, 6)))
+        assert seen[-1].dtype == np.float32